@@ -1,12 +1,46 @@
-from sqlalchemy import create_engine, MetaData, Table,column, inspect
+from sqlalchemy import create_engine, event, MetaData, Table,column, inspect
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from vorys.schema import SQLITE_PRAGMAS, ensure_schema
 
 # Path to your existing SQLite DB
 DATABASE_URL = "sqlite:///./sourav.db"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# A real connection pool, so concurrent dashboard reads don't queue behind one connection.
+# Sized for FastAPI's worker threadpool: 10 kept open, up to 30 under bursts.
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False, "timeout": 5},
+    poolclass=QueuePool,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
+
+
+# WAL lets the dashboard keep reading while the spider writes, and busy_timeout
+# waits on a locked DB instead of failing straight away. Runs once per new connection.
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragma(dbapi_conn, _):
+    cur = dbapi_conn.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cur.execute(pragma)
+    cur.execute("PRAGMA busy_timeout=5000")
+    cur.close()
+
+
+# Bring sourav.db up to the current schema before reflecting it, instead of waiting for the
+# first crawl: the API needs the id column and FTS index from the start, and reflects only once
+raw_connection = engine.raw_connection()
+try:
+    ensure_schema(raw_connection.driver_connection)
+finally:
+    raw_connection.close()
+
 metadata = MetaData()
-metadata.reflect(bind=engine)
+metadata.reflect(bind=engine, only=['vorysdata'])  # skip the FTS virtual/shadow tables
 scraped_data = metadata.tables['vorysdata']
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -1,7 +1,9 @@
 import streamlit as st
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 import json # Import json for better error handling of API responses
+import orjson # Fast C JSON parser for the larger list responses
 import plotly.express as px # For charting
 
 # --- Configuration ---
@@ -11,7 +13,9 @@ CONFIG = {
     "CACHE_TTL_SECONDS": 120, # Cache data for 2 minutes
     "PAGE_TITLE": "Enterprise Data Scraper Dashboard",
     "PAGE_ICON": "📊", # Emoji icon for the page title
-    "DEFAULT_SELECT_OPTION": "-- Select --"
+    "DEFAULT_SELECT_OPTION": "-- Select --",
+    "PREVIEW_ROW_LIMIT": 1000, # Rows shown per "Load more" step on the View All Records page
+    "TOP_COMPANIES_LIMIT": 50 # Bars shown in the company distribution chart
 }
 
 st.set_page_config(
@@ -27,58 +31,149 @@ def reorder_dataframe_columns(df):
     if df.empty:
         return df
 
-    # Desired order for the first few columns
-    desired_first_columns = ['id', 'name','company']
-    
-    # Get existing columns
-    existing_columns = df.columns.tolist()
-    
-    # Identify columns that are in desired_first_columns and also in the DataFrame
-    # Preserve their order
-    reordered_columns = [col for col in desired_first_columns if col in existing_columns]
-    
-    # Add any other existing columns that are not in the desired_first_columns
-    # Ensure they are added only if they are not already in reordered_columns
-    for col in existing_columns:
-        if col not in reordered_columns:
-            reordered_columns.append(col)
-
-    return df[reordered_columns]
+    # Desired order for the first few columns, keeping only those present
+    first = [col for col in ('id', 'name', 'company') if col in df.columns]
+    if df.columns[:len(first)].tolist() == first:
+        return df  # Already in order (the usual case), nothing to reindex
+
+    first_set = set(first)
+    return df[first + [col for col in df.columns if col not in first_set]]
 
 
 # --- Helper Functions for API Calls ---
 
-@st.cache_data(ttl=CONFIG["CACHE_TTL_SECONDS"])
+@st.cache_resource
+def api_session():
+    """One shared HTTP session, so API calls reuse pooled keep-alive connections."""
+    session = requests.Session()
+    session.headers.update({"Accept": "application/json"})
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def dataframe_from_records(records):
+    """Builds an Arrow-backed DataFrame from a list of JSON records.
+
+    Arrow keeps string columns in contiguous buffers instead of one Python
+    object per cell, so value_counts, str.contains and to_csv run on Arrow kernels.
+    """
+    return pd.DataFrame(records).convert_dtypes(dtype_backend="pyarrow")
+
+def dataframe_from_response(response):
+    """Parses a JSON list response with orjson into an Arrow-backed DataFrame."""
+    return dataframe_from_records(orjson.loads(response.content))
+
+EMPTY_BOOTSTRAP = {"rows": pd.DataFrame(), "ids": []}
+
+def ids_from_rows(rows):
+    return sorted(rows["id"].dropna().astype(int).tolist()) if "id" in rows.columns else []
+
+# One /bootstrap round trip returns what the record pages share: all rows and the record ids
+# for the Edit/Delete pickers. cache_resource hands every page the same objects instead of
+# unpickling a fresh copy on each hit; callers must .copy() a frame before mutating it.
+@st.cache_resource(ttl=CONFIG["CACHE_TTL_SECONDS"])
+def bootstrap():
+    try:
+        response = api_session().get(f"{CONFIG['API_URL']}/bootstrap")
+        if response.status_code == 404:
+            # API without /bootstrap: fall back to the plain full-table fetch
+            response = api_session().get(f"{CONFIG['API_URL']}/")
+            response.raise_for_status()
+            rows = reorder_dataframe_columns(dataframe_from_response(response))
+            return {"rows": rows, "ids": ids_from_rows(rows)}
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
+        return {
+            "rows": reorder_dataframe_columns(dataframe_from_records(payload["rows"])),
+            "ids": sorted(int(x) for x in payload["ids"]),
+        }
+    except requests.exceptions.ConnectionError:
+        st.error(f"⚠️ Could not connect to the API at {CONFIG['API_URL']}. Please ensure the FastAPI backend is running.")
+        return EMPTY_BOOTSTRAP
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError, KeyError) as e:
+        st.error(f"❌ Error fetching dashboard data: {e}")
+        return EMPTY_BOOTSTRAP
+
 def get_all_data():
+    return bootstrap()["rows"]
+
+def get_record_ids():
+    return bootstrap()["ids"]
+
+@st.cache_data(ttl=CONFIG["CACHE_TTL_SECONDS"])
+def get_single_company_data(company_name):
     try:
-        response = requests.get(f"{CONFIG['API_URL']}/")
+        # Quoted so names containing "/", "&" or "#" stay a single path segment
+        response = api_session().get(f"{CONFIG['API_URL']}/company/{requests.utils.quote(company_name, safe='')}")
+        if response.status_code == 404:
+            # API without the /company route: filter the full table here instead
+            rows = get_all_data()
+            if "company" not in rows.columns:
+                return pd.DataFrame()
+            return rows[rows["company"] == company_name]
         response.raise_for_status()
-        df = pd.DataFrame(response.json())
+        df = dataframe_from_response(response)
         return reorder_dataframe_columns(df) # Apply reordering here
     except requests.exceptions.ConnectionError:
         st.error(f"⚠️ Could not connect to the API at {CONFIG['API_URL']}. Please ensure the FastAPI backend is running.")
         return pd.DataFrame()
     except requests.exceptions.RequestException as e:
-        st.error(f"❌ Error fetching all data: {e}")
+        st.error(f"❌ Error fetching data for {company_name}: {e}")
         return pd.DataFrame()
 
 @st.cache_data(ttl=CONFIG["CACHE_TTL_SECONDS"])
-def get_single_company_data(company_name):
+def get_company_counts():
+    """Per-company record counts, aggregated by the API (one row per company)."""
     try:
-        response = requests.get(f"{CONFIG['API_URL']}/company/{company_name}")
+        response = api_session().get(f"{CONFIG['API_URL']}/stats/company_counts")
+        if response.status_code == 404:
+            # API without the stats endpoint: count the full table here instead. Null companies
+            # keep their own row so "Total Records" (the sum of counts) still covers every record
+            rows = get_all_data()
+            if "company" not in rows.columns:
+                return pd.DataFrame()
+            return rows["company"].value_counts(dropna=False).rename_axis("company").reset_index(name="count")
         response.raise_for_status()
-        df = pd.DataFrame(response.json())
-        return reorder_dataframe_columns(df) # Apply reordering here
+        return dataframe_from_response(response)
     except requests.exceptions.ConnectionError:
         st.error(f"⚠️ Could not connect to the API at {CONFIG['API_URL']}. Please ensure the FastAPI backend is running.")
         return pd.DataFrame()
     except requests.exceptions.RequestException as e:
-        st.error(f"❌ Error fetching data for {company_name}: {e}")
+        st.error(f"❌ Error fetching company statistics: {e}")
         return pd.DataFrame()
 
+# Each distinct filtered frame gets its own entry, so the cache is capped by count as well as age
+@st.cache_data(ttl=CONFIG["CACHE_TTL_SECONDS"], max_entries=20)
+def df_to_csv_bytes(df):
+    """CSV-encodes a frame; Streamlit's DataFrame hashing reuses the bytes while the data is unchanged."""
+    return df.to_csv(index=False).encode('utf-8')
+
+SEARCH_COLUMNS = ['company', 'name', 'designation', 'email']
+
+@st.cache_resource(ttl=CONFIG["CACHE_TTL_SECONDS"])
+def get_search_index(company_name=None):
+    """Returns the rows to search plus one pre-lowercased search string per row.
+
+    The lowercasing runs once per data refresh, so each search is a single
+    str.contains scan. Columns are joined with a newline, which can't be typed
+    into the search box, so matches never span two fields.
+    """
+    df = get_single_company_data(company_name) if company_name else get_all_data()
+    lowered = [df[col].astype("string[pyarrow]").str.lower() for col in SEARCH_COLUMNS if col in df.columns]
+    if not lowered:
+        return df, pd.Series("", index=df.index, dtype="string[pyarrow]")
+    return df, lowered[0].str.cat(lowered[1:], sep="\n", na_rep="")
+
+def clear_cached_data():
+    """Drops all cached API responses so the next read goes back to the API."""
+    st.cache_data.clear()
+    bootstrap.clear()
+    get_search_index.clear()
+
 def post_record(data):
     try:
-        response = requests.post(f"{CONFIG['API_URL']}/upload", json=data)
+        response = api_session().post(f"{CONFIG['API_URL']}/upload", json=data)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.ConnectionError:
@@ -91,7 +186,7 @@ def post_record(data):
 
 def update_record_api(record_id, data):
     try:
-        response = requests.put(f"{CONFIG['API_URL']}/update/{record_id}", json=data)
+        response = api_session().put(f"{CONFIG['API_URL']}/update/{record_id}", json=data)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.ConnectionError:
@@ -104,7 +199,7 @@ def update_record_api(record_id, data):
 
 def delete_record_api(record_id):
     try:
-        response = requests.delete(f"{CONFIG['API_URL']}/delete/{record_id}")
+        response = api_session().delete(f"{CONFIG['API_URL']}/delete/{record_id}")
         response.raise_for_status()
         return response.json()
     except requests.exceptions.ConnectionError:
@@ -115,6 +210,118 @@ def delete_record_api(record_id):
         st.error(f"❌ Failed to delete record. Error: {e}. Detail: {error_detail}")
         return None
 
+# --- Page Sections ---
+# Fragments rerun on their own when their widgets change, instead of replaying the whole script.
+
+@st.fragment
+def company_chart_section():
+    """Bar chart of the companies with the most records."""
+    # Company Distribution Chart
+    st.subheader("Company Record Distribution")
+    # Only the per-company counts are needed here, never the full table
+    company_counts = get_company_counts()
+    top_companies = (
+        company_counts.dropna(subset=["company"]).nlargest(CONFIG["TOP_COMPANIES_LIMIT"], "count")
+        .rename(columns={"company": "Company", "count": "Count"})
+        if not company_counts.empty else company_counts
+    )
+    if not top_companies.empty:
+        fig = px.bar(
+            top_companies,
+            x='Company',
+            y='Count',
+            title=f"Number of Records per Company (Top {CONFIG['TOP_COMPANIES_LIMIT']})",
+            labels={'Company': 'Company Name', 'Count': 'Count'},
+            color='Count',
+            color_continuous_scale=px.colors.sequential.Plasma
+        )
+        fig.update_layout(xaxis_tickangle=-45)
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("No company data available for distribution chart.")
+
+@st.fragment
+def records_preview_section():
+    """Bounded preview of all records with "Load more" and the full CSV export."""
+    # Render a bounded preview; "Load more" raises the limit one step at a time
+    if "view_all_limit" not in st.session_state:
+        st.session_state.view_all_limit = CONFIG["PREVIEW_ROW_LIMIT"]
+
+    with st.spinner("Fetching records..."):
+        all_data = get_all_data()
+
+    if all_data.empty:
+        st.warning("No records found in the database. Add new records via the 'Add New Record' section.")
+    else:
+        preview = all_data.head(st.session_state.view_all_limit)
+        st.dataframe(preview, use_container_width=True, hide_index=True)
+        st.info(f"Records displayed: **{len(preview)}** of **{len(all_data)}**")
+
+        if len(preview) < len(all_data):
+            if st.button("Load more", help=f"Show the next {CONFIG['PREVIEW_ROW_LIMIT']} records."):
+                st.session_state.view_all_limit += CONFIG["PREVIEW_ROW_LIMIT"]
+                st.rerun(scope="fragment")
+
+        # The export covers every record, not just the preview
+        st.download_button(
+            label="⬇️ Download All Data as CSV",
+            data=df_to_csv_bytes(all_data),
+            file_name="all_scraped_data.csv",
+            mime="text/csv",
+            help="Download every record in the database as a CSV file."
+        )
+
+@st.fragment
+def filter_search_section(companies):
+    """Company filter and keyword search over the cached search index."""
+    col_filter, col_search = st.columns([1, 2])
+
+    with col_filter:
+        selected_company = st.selectbox(
+            "Filter by Company:",
+            options=[CONFIG["DEFAULT_SELECT_OPTION"]] + companies,
+            help="Choose a company name to narrow down the records."
+        )
+    with col_search:
+        # A form only reruns the search on submit, not on every keystroke
+        with st.form("search_form"):
+            search_input = st.text_input(
+                "Search keywords:",
+                value=st.session_state.get("last_q", ""),
+                placeholder="e.g., John Doe, Manager, example@mail.com",
+                help="Search across Company, Name, Designation, and Email fields."
+            )
+            if st.form_submit_button("Search"):
+                st.session_state["last_q"] = search_input.strip()
+        # Keep the last submitted query so results persist across unrelated reruns
+        search_query = st.session_state.get("last_q", "")
+
+    # Apply company filter on the API side, so only that company's rows are returned
+    company_filter = selected_company if selected_company != CONFIG["DEFAULT_SELECT_OPTION"] else None
+    with st.spinner("Preparing search..."):
+        filtered_search_data, search_haystack = get_search_index(company_filter)
+
+    # Apply text search: a single scan over the pre-lowercased search text
+    if search_query:
+        mask = search_haystack.str.contains(search_query.lower(), na=False, regex=False)
+        filtered_search_data = filtered_search_data[mask]
+
+    st.markdown("---")
+    st.subheader("Filtered Results")
+    if filtered_search_data.empty:
+        st.warning("No records match your current filter/search criteria.")
+    else:
+        st.dataframe(filtered_search_data, use_container_width=True, hide_index=True)
+        st.info(f"Showing **{len(filtered_search_data)}** record(s) matching your criteria.")
+
+        st.download_button(
+            label="⬇️ Download Filtered Data as CSV",
+            data=df_to_csv_bytes(filtered_search_data),
+            file_name="filtered_scraped_data.csv",
+            mime="text/csv",
+            help="Download the currently filtered and searched records as a CSV file."
+        )
+
 # --- Main Dashboard Structure ---
 
 st.title(f"{CONFIG['PAGE_ICON']} {CONFIG['PAGE_TITLE']}")
@@ -132,69 +339,41 @@ page_selection = st.sidebar.radio(
     ["Dashboard Overview", "View All Records", "Filter & Search Records", "Add New Record", "Edit Record", "Manage Records (Delete)", "About"]
 )
 
+# API responses are cached between reruns; this forces a reload (e.g. after running the scraper)
+if st.sidebar.button("🔄 Refresh Data", help="Clear cached API responses and fetch fresh data."):
+    clear_cached_data()
+    st.rerun()
+
 # --- Main Content Area based on Navigation ---
 
 if page_selection == "Dashboard Overview":
     st.header("📊 Dashboard Overview")
     st.markdown("Get a quick glance at your scraped data statistics.")
 
+    # Only the per-company counts are needed here, not every row of the table
     with st.spinner("Loading dashboard data..."):
-        all_data = get_all_data() # This now returns reordered columns
+        company_counts = get_company_counts()
 
-    if all_data.empty:
+    if company_counts.empty:
         st.warning("No data available to display dashboard overview. Please add some records.")
     else:
         # Metrics
         col_total, col_unique = st.columns(2)
         with col_total:
-            st.metric(label="Total Records", value=len(all_data))
+            st.metric(label="Total Records", value=int(company_counts["count"].sum()))
         with col_unique:
-            unique_companies = all_data["company"].dropna().unique()
-            st.metric(label="Unique Companies", value=len(unique_companies))
+            st.metric(label="Unique Companies", value=int(company_counts["company"].notna().sum()))
 
         st.markdown("---")
 
-        # Company Distribution Chart
-        st.subheader("Company Record Distribution")
-        # Ensure 'company' column exists before value_counts
-        if 'company' in all_data.columns and not all_data['company'].empty:
-            company_counts = all_data["company"].value_counts().reset_index()
-            company_counts.columns = ['Company', 'Number of Records']
-            fig = px.bar(
-                company_counts,
-                x='Company',
-                y='Number of Records',
-                title='Number of Records per Company',
-                labels={'Company': 'Company Name', 'Number of Records': 'Count'},
-                color='Number of Records',
-                color_continuous_scale=px.colors.sequential.Plasma
-            )
-            fig.update_layout(xaxis_tickangle=-45)
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("No company data available for distribution chart.")
+        company_chart_section()
 
 
 elif page_selection == "View All Records":
     st.header("📋 All Scraped Records")
     st.markdown("This section displays every record currently in your database.")
 
-    with st.spinner("Fetching all records..."):
-        all_data = get_all_data() # This now returns reordered columns
-
-    if all_data.empty:
-        st.warning("No records found in the database. Add new records via the 'Add New Record' section.")
-    else:
-        st.dataframe(all_data, use_container_width=True, hide_index=True)
-        st.info(f"Total records displayed: **{len(all_data)}**")
-
-        st.download_button(
-            label="⬇️ Download All Data as CSV",
-            data=all_data.to_csv(index=False).encode('utf-8'),
-            file_name="all_scraped_data.csv",
-            mime="text/csv",
-            help="Download all currently visible records as a CSV file."
-        )
+    records_preview_section()
 
 
 elif page_selection == "Filter & Search Records":
@@ -207,55 +386,7 @@ elif page_selection == "Filter & Search Records":
         companies = filter_data_df["company"].dropna().unique().tolist()
         companies = sorted(companies)
 
-    col_filter, col_search = st.columns([1, 2])
-
-    with col_filter:
-        selected_company = st.selectbox(
-            "Filter by Company:",
-            options=[CONFIG["DEFAULT_SELECT_OPTION"]] + companies,
-            help="Choose a company name to narrow down the records."
-        )
-    with col_search:
-        search_query = st.text_input(
-            "Search keywords:",
-            placeholder="e.g., John Doe, Manager, example@mail.com",
-            help="Search across Company, Name, Designation, and Email fields."
-        )
-
-    filtered_search_data = filter_data_df.copy()
-
-    # Apply company filter
-    if selected_company != CONFIG["DEFAULT_SELECT_OPTION"]:
-        filtered_search_data = filtered_search_data[filtered_search_data["company"] == selected_company]
-
-    # Apply text search
-    if search_query:
-        search_query_lower = search_query.lower()
-        filtered_search_data = filtered_search_data[
-            filtered_search_data.apply(lambda row:
-                search_query_lower in str(row['company']).lower() or
-                search_query_lower in str(row['name']).lower() or
-                search_query_lower in str(row['designation']).lower() or
-                search_query_lower in str(row['email']).lower(),
-                axis=1
-            )
-        ]
-
-    st.markdown("---")
-    st.subheader("Filtered Results")
-    if filtered_search_data.empty:
-        st.warning("No records match your current filter/search criteria.")
-    else:
-        st.dataframe(filtered_search_data, use_container_width=True, hide_index=True)
-        st.info(f"Showing **{len(filtered_search_data)}** record(s) matching your criteria.")
-
-        st.download_button(
-            label="⬇️ Download Filtered Data as CSV",
-            data=filtered_search_data.to_csv(index=False).encode('utf-8'),
-            file_name="filtered_scraped_data.csv",
-            mime="text/csv",
-            help="Download the currently filtered and searched records as a CSV file."
-        )
+    filter_search_section(companies)
 
 elif page_selection == "Add New Record":
     st.header("➕ Add New Record")
@@ -297,7 +428,7 @@ elif page_selection == "Add New Record":
                     res = post_record(data)
                 if res:
                     st.success(f"🎉 Record for **{new_name}** at **{new_company}** added successfully! ID: `{res.get('id', 'N/A')}`")
-                    st.cache_data.clear() # Clear cache to ensure updated data is fetched next time
+                    clear_cached_data() # Clear cache to ensure updated data is fetched next time
                     # st.rerun() # Rerun can cause inputs to momentarily reappear
                 else:
                     st.error("🚫 Failed to add record. Please check the API status and inputs provided.")
@@ -311,14 +442,8 @@ elif page_selection == "Edit Record":
     if all_current_data.empty:
         st.warning("No records available to edit. Please add some first.")
     else:
-        # Ensure 'id' column exists and is numeric
-        if 'id' in all_current_data.columns:
-            record_ids = all_current_data["id"].dropna().unique().tolist()
-            # Convert to int, handle potential non-numeric values gracefully
-            record_ids = sorted([int(x) for x in record_ids if pd.notna(x) and str(x).isdigit()])
-        else:
-            record_ids = []
-            st.error("The 'id' column is missing from the fetched data, cannot edit records.")
+        # Sorted ids come precomputed in the bootstrap payload
+        record_ids = get_record_ids()
 
         if not record_ids:
             st.warning("No valid record IDs found to edit.")
@@ -355,22 +480,28 @@ elif page_selection == "Edit Record":
                     st.warning(f"No data found for ID {int(edit_id)}. It might have been deleted.")
                     selected_record_data = None # Reset if data not found
 
+            # Resolve the form defaults once instead of indexing the Series per field
+            record_defaults = (
+                {k: v for k, v in selected_record_data.items() if pd.notna(v)}
+                if selected_record_data is not None else {}
+            )
+
             with st.form("edit_record_form"):
                 st.subheader("Update Information")
                 col_comp_edit, col_name_edit = st.columns(2)
                 with col_comp_edit:
-                    edited_company = st.text_input("Company Name", value=selected_record_data["company"] if selected_record_data is not None and "company" in selected_record_data else "", key="edit_company")
+                    edited_company = st.text_input("Company Name", value=record_defaults.get("company", ""), key="edit_company")
                 with col_name_edit:
-                    edited_name = st.text_input("Contact Name", value=selected_record_data["name"] if selected_record_data is not None and "name" in selected_record_data else "", key="edit_name")
+                    edited_name = st.text_input("Contact Name", value=record_defaults.get("name", ""), key="edit_name")
 
                 col_desig_edit, col_phone_edit = st.columns(2)
                 with col_desig_edit:
-                    edited_designation = st.text_input("Designation", value=selected_record_data["designation"] if selected_record_data is not None and "designation" in selected_record_data else "", key="edit_designation")
+                    edited_designation = st.text_input("Designation", value=record_defaults.get("designation", ""), key="edit_designation")
                 with col_phone_edit:
-                    edited_phone = st.text_input("Phone Number", value=selected_record_data["phone"] if selected_record_data is not None and "phone" in selected_record_data else "", key="edit_phone")
+                    edited_phone = st.text_input("Phone Number", value=record_defaults.get("phone", ""), key="edit_phone")
 
-                edited_email = st.text_input("Email Address", value=selected_record_data["email"] if selected_record_data is not None and "email" in selected_record_data else "", key="edit_email")
-                edited_description = st.text_area("Description / Notes", value=selected_record_data["description"] if selected_record_data is not None and "description" in selected_record_data else "", key="edit_description")
+                edited_email = st.text_input("Email Address", value=record_defaults.get("email", ""), key="edit_email")
+                edited_description = st.text_area("Description / Notes", value=record_defaults.get("description", ""), key="edit_description")
 
                 st.markdown("---")
                 update_submit_button = st.form_submit_button("Update Record")
@@ -393,7 +524,7 @@ elif page_selection == "Edit Record":
                             update_res = update_record_api(int(edit_id), updated_data)
                         if update_res:
                             st.success(f"✅ Record ID **{int(edit_id)}** updated successfully!")
-                            st.cache_data.clear()
+                            clear_cached_data()
                             # After successful update, ideally re-select the default or a relevant state
                             # For simplicity, we can clear the current selection
                             st.session_state.edit_id_selectbox = CONFIG["DEFAULT_SELECT_OPTION"]
@@ -405,47 +536,36 @@ elif page_selection == "Manage Records (Delete)":
     st.header("🗑️ Delete Records")
     st.markdown("Permanently remove records from your database. This action cannot be undone.")
 
-    # Get all IDs for deletion
-    all_current_data = get_all_data()
-    if all_current_data.empty:
+    # Get all IDs for deletion (sorted, from the bootstrap payload)
+    delete_record_ids = get_record_ids()
+    if not delete_record_ids:
         st.warning("No records found to delete.")
     else:
-        # Ensure 'id' column exists and is numeric
-        if 'id' in all_current_data.columns:
-            delete_record_ids = all_current_data["id"].dropna().unique().tolist()
-            delete_record_ids = sorted([int(x) for x in delete_record_ids if pd.notna(x) and str(x).isdigit()])
-        else:
-            delete_record_ids = []
-            st.error("The 'id' column is missing from the fetched data, cannot delete records.")
-
-        if not delete_record_ids:
-            st.warning("No valid record IDs found to delete.")
-        else:
-            delete_id_selection = st.selectbox(
-                "Select ID to delete:",
-                options=[CONFIG["DEFAULT_SELECT_OPTION"]] + delete_record_ids,
-                help="Choose the unique ID of the record you want to remove."
-            )
+        delete_id_selection = st.selectbox(
+            "Select ID to delete:",
+            options=[CONFIG["DEFAULT_SELECT_OPTION"]] + delete_record_ids,
+            help="Choose the unique ID of the record you want to remove."
+        )
 
-            delete_button = st.button("Delete Selected Record", type="secondary", icon="🗑️")
-
-            if delete_button and delete_id_selection != CONFIG["DEFAULT_SELECT_OPTION"]:
-                # Use a confirmation flow
-                confirm_delete_placeholder = st.empty() # Placeholder for the warning
-                if confirm_delete_placeholder.warning(f"Are you absolutely sure you want to delete record with ID **{int(delete_id_selection)}**? This action cannot be undone."):
-                    if st.button("Confirm Permanent Deletion", key="confirm_del_btn", type="primary", icon="🔥"):
-                        with st.spinner(f"Deleting record {int(delete_id_selection)}..."):
-                            del_res = delete_record_api(int(delete_id_selection))
-                        if del_res:
-                            st.success(f"🗑️ Record with ID **{int(delete_id_selection)}** deleted successfully!")
-                            st.cache_data.clear() # Clear cache to ensure updated data is fetched
-                            st.rerun() # Rerun to refresh the dashboard
-                        else:
-                            st.error("🚫 Failed to delete record. Please ensure the ID is correct and the API is running.")
+        delete_button = st.button("Delete Selected Record", type="secondary", icon="🗑️")
+
+        if delete_button and delete_id_selection != CONFIG["DEFAULT_SELECT_OPTION"]:
+            # Use a confirmation flow
+            confirm_delete_placeholder = st.empty() # Placeholder for the warning
+            if confirm_delete_placeholder.warning(f"Are you absolutely sure you want to delete record with ID **{int(delete_id_selection)}**? This action cannot be undone."):
+                if st.button("Confirm Permanent Deletion", key="confirm_del_btn", type="primary", icon="🔥"):
+                    with st.spinner(f"Deleting record {int(delete_id_selection)}..."):
+                        del_res = delete_record_api(int(delete_id_selection))
+                    if del_res:
+                        st.success(f"🗑️ Record with ID **{int(delete_id_selection)}** deleted successfully!")
+                        clear_cached_data() # Clear cache to ensure updated data is fetched
+                        st.rerun() # Rerun to refresh the dashboard
                     else:
-                        st.info("Deletion cancelled.")
-            elif delete_button and delete_id_selection == CONFIG["DEFAULT_SELECT_OPTION"]:
-                st.warning("Please select a valid record ID to delete.")
+                        st.error("🚫 Failed to delete record. Please ensure the ID is correct and the API is running.")
+                else:
+                    st.info("Deletion cancelled.")
+        elif delete_button and delete_id_selection == CONFIG["DEFAULT_SELECT_OPTION"]:
+            st.warning("Please select a valid record ID to delete.")
 
 elif page_selection == "About":
     st.header("ℹ️ About This Dashboard")
@@ -1,10 +1,115 @@
-import subprocess
-from fastapi import FastAPI, Depends, HTTPException
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+import orjson
+from fastapi import FastAPI, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from sqlalchemy import select, text
 from sqlalchemy.orm import Session
 from database import engine, metadata, SessionLocal, scraped_data
 from pydantic import BaseModel
+from response_cache import ResponseCache
+import spider_runner
 
-app =  FastAPI()
+
+@asynccontextmanager
+async def lifespan(app):
+    spider_runner.start_reactor()
+    yield
+
+
+# orjson serializes the non-streamed responses; the list endpoints stream orjson-encoded rows themselves
+app =  FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+logger = logging.getLogger(__name__)
+
+# Cached GET routes: freshness in seconds, and the query params the route reads.
+# Only those params go into the cache key, so unknown ones can't mint extra entries.
+CACHE_POLICIES = {
+    "/sourav/paginated": {"ttl": 10, "params": ("after_id", "limit")},
+    "/sourav/search": {"ttl": 30, "params": ("name", "location")},
+    "/sourav": {"ttl": 30, "params": ()},
+}
+response_cache = ResponseCache()
+
+
+def invalidate_cached_reads():
+    """Drops the cached GET responses once the underlying rows have changed."""
+    response_cache.invalidate_prefix("/sourav")
+
+
+class CacheGetResponses:
+    """Serves the GET routes in CACHE_POLICIES from response_cache.
+
+    A miss streams straight through to the client while the body is collected, and
+    is stored only once the final body message has gone out, so a response that fails
+    part-way is never cached. If the handler fails before responding, or returns a 5xx,
+    a stale cached copy is served instead, e.g. while a crawl has the DB locked.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        policy = CACHE_POLICIES.get(scope["path"]) if scope["type"] == "http" and scope["method"] == "GET" else None
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        query_params = Request(scope).query_params
+        key = f"{scope['path']}?{[(name, query_params.getlist(name)) for name in policy['params']]}"
+        # sqlite3 calls block, so they run on the threadpool rather than the event loop
+        cached = await run_in_threadpool(response_cache.get, key)
+        if cached is not None and cached[2]:
+            await self.send_cached(cached, "HIT", scope, receive, send)
+            return
+
+        started = False
+        serve_stale = False
+        cacheable = False
+        media_type = None
+        chunks = []
+
+        async def send_through(message):
+            nonlocal started, serve_stale, cacheable, media_type
+            if message["type"] == "http.response.start":
+                started = True
+                if message["status"] >= 500 and cached is not None:
+                    serve_stale = True
+                    return
+                if message["status"] == 200:
+                    cacheable = True
+                    headers = MutableHeaders(scope=message)
+                    media_type = headers.get("content-type")
+                    headers["X-Cache"] = "MISS"
+            elif message["type"] == "http.response.body":
+                if serve_stale:
+                    return
+                if cacheable:
+                    chunks.append(message.get("body", b""))
+                    if not message.get("more_body", False):
+                        await run_in_threadpool(response_cache.set, key, b"".join(chunks), media_type, policy["ttl"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_through)
+        except Exception:
+            # Once a real response has started going out there's nothing to swap in
+            if cached is None or (started and not serve_stale):
+                raise
+            serve_stale = True
+
+        if serve_stale:
+            await self.send_cached(cached, "STALE", scope, receive, send)
+
+    @staticmethod
+    async def send_cached(cached, cache_status, scope, receive, send):
+        body, media_type, _ = cached
+        await Response(body, media_type=media_type, headers={"X-Cache": cache_status})(scope, receive, send)
+
+
+app.add_middleware(CacheGetResponses)
 
   # Assuming 'vorysdata' is the name of your table in the SQLite DB
 
@@ -22,102 +127,160 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def stream_json_rows(query):
+    """Yields the rows of ``query`` as a JSON array, one cursor batch at a time.
+
+    The generator opens its own connection so it stays valid for the whole
+    response body, after request-scoped sessions may already be closed.
+    """
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=500).execute(query)
+        # Reflected column names are quoted_name (a str subclass), which orjson rejects as keys
+        keys = [str(key) for key in result.keys()]
+        yield b"["
+        separator = b""
+        for rows in result.partitions():
+            yield separator + b",".join(orjson.dumps(dict(zip(keys, row))) for row in rows)
+            separator = b","
+        yield b"]"
+
+
 # GET REQUESTS :
 @app.get("/sourav")
-def get_scraped_data(db: Session = Depends(get_db)):
-    results = db.execute(scraped_data.select()).fetchall()
-    return [dict(row._mapping) for row in results]
+def get_scraped_data():
+    return StreamingResponse(stream_json_rows(scraped_data.select()), media_type="application/json")
 
 
 @app.get("/sourav-updated")
-def get_updated_data(db: Session = Depends(get_db)):
-    try:
-        # Replace with the correct path to your scrapy project folder
-        project_path = r"D:\Learning\1scraped_data\vorys"  # raw string path (Windows)
-        
-        result = subprocess.run(
-            ["scrapy", "crawl", "vorysdata"],
-            cwd=project_path,
-            check=True,
-            capture_output=True,
-            text=True
-        )
+async def get_updated_data():
+    if spider_lock.locked():
+        raise HTTPException(status_code=409, detail="Spider is already running")
+    async with spider_lock:
+        try:
+            await asyncio.wrap_future(spider_runner.crawl())
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Scraping failed: {e}")
 
-        # After spider finishes, get updated data
-        results = db.execute(scraped_data.select()).fetchall()
-        return [dict(row._mapping) for row in results]
+    # After spider finishes, get updated data
+    invalidate_cached_reads()
+    return StreamingResponse(stream_json_rows(scraped_data.select()), media_type="application/json")
 
-    except subprocess.CalledProcessError as e:
-        raise HTTPException(status_code=500, detail=f"Scraping failed: {e}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+
+def fts_column_filter(column, term):
+    """FTS5 filter matching ``term`` anywhere in ``column`` (a quoted trigram phrase)."""
+    return f'{column} : "{term.replace(chr(34), chr(34) * 2)}"'
 
 
 @app.get("/sourav/search")
-def search_scraped_data(name: str = "", location: str = "", db: Session = Depends(get_db)):
+def search_scraped_data(name: str = "", location: str = ""):
     query = scraped_data.select()
-    if name:
-        query = query.where(scraped_data.c.name.ilike(f"%{name.lower()}%"))
-    if location:
-        query = query.where(scraped_data.c.location.ilike(f"%{location.lower()}%"))
-    
-    results = db.execute(query).fetchall()
-    return [dict(row._mapping) for row in results]
+    match_filters = []
+    for column, term in (("name", name.strip()), ("location", location.strip())):
+        if not term:
+            continue  # Blank params add no predicate at all
+        if len(term) >= 3:
+            match_filters.append(fts_column_filter(column, term))
+        else:
+            # Trigrams need at least 3 characters; shorter terms fall back to LIKE, which is
+            # already case-insensitive on these NOCASE columns, so no lower() on either side
+            query = query.where(scraped_data.c[column].like(f"%{term}%"))
+    if match_filters:
+        query = query.where(
+            text("vorysdata.rowid IN (SELECT rowid FROM vorysdata_fts WHERE vorysdata_fts MATCH :match)")
+            .bindparams(match=" AND ".join(match_filters))
+        )
+
+    return StreamingResponse(stream_json_rows(query), media_type="application/json")
+
+
+# Largest page /sourav/paginated will build in memory; bigger reads should use /sourav or /sourav/export
+MAX_PAGE_SIZE = 500
 
 
 @app.get("/sourav/paginated")
-def paginated_scraped_data(skip: int = 0, limit: int = 20, db: Session = Depends(get_db)):
-    query = scraped_data.select().offset(skip).limit(limit)
-    results = db.execute(query).fetchall()
-    return [dict(row._mapping) for row in results]
+def paginated_scraped_data(
+    after_id: int | None = None,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    # Keyset pagination: seek past the last id seen instead of OFFSET-scanning skipped rows
+    query = scraped_data.select().order_by(scraped_data.c.id).limit(limit)
+    if after_id is not None:
+        query = query.where(scraped_data.c.id > after_id)
+
+    # A page is bounded by `limit`, so it's built in memory to report the cursor for the next one
+    items = [dict(row._mapping) for row in db.execute(query)]
+    return {
+        "items": items,
+        "next_after": items[-1]["id"] if len(items) == limit else None,
+    }
 
 
 # for run task in background: 
 from fastapi import BackgroundTasks
 
-scraping_status = {"running": False}
-def run_spider():
-    try:
-        scraping_status["running"] = True
-        project_path = r"D:\Learning\1scraped_data\vorys"
-        result = subprocess.run(
-            ["scrapy", "crawl", "vorysdata"],
-            cwd=project_path,
-            capture_output=True,
-            text=True
-        )
-        print("STDOUT:", result.stdout)
-        print("STDERR:", result.stderr)
-    finally:
-        scraping_status["running"] = False
+# Held for the whole crawl, so two requests can never run spiders against the DB at once
+spider_lock = asyncio.Lock()
+
+async def run_spider():
+    # The lock is taken here rather than in run_scraper_async, so it is only ever held by a
+    # task that is running and will release it. An uncontended acquire doesn't yield, so no
+    # other launch can get in between the check and the acquire.
+    if spider_lock.locked():
+        logger.warning("Spider is already running; skipping this launch")
+        return
+    async with spider_lock:
+        try:
+            # Awaited on the event loop, so no threadpool worker is held for the whole crawl
+            await asyncio.wrap_future(spider_runner.crawl())
+            invalidate_cached_reads()
+        except Exception:
+            logger.exception("Scraping failed")
 @app.get("/")
-def run_scraper_async(bg_tasks: BackgroundTasks):
+async def run_scraper_async(bg_tasks: BackgroundTasks):
+    if spider_lock.locked():
+        raise HTTPException(status_code=409, detail="Spider is already running")
     bg_tasks.add_task(run_spider)
     return {"message": "Spider started in background"}
 
 @app.get("/status")
 def get_scrape_status():
-    return {"scraping": scraping_status["running"]}
+    return {"scraping": spider_lock.locked()}
 
 
 
-from fastapi.responses import StreamingResponse
-import io
 import csv
+import io
+
+# Rows are written into a small reusable buffer and sent in chunks of about this size
+CSV_CHUNK_SIZE = 64 * 1024
 
-@app.get("/sourav/export")
-def export_scraped_data(db: Session = Depends(get_db)):
-    results = db.execute(scraped_data.select()).fetchall()
 
-    # Generate CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(scraped_data.columns.keys())  # headers
-    for row in results:
-        writer.writerow(list(row))
+def stream_csv_rows(query):
+    """Yields the header and rows of ``query`` as CSV, in ~64 KiB chunks straight off the cursor."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=1000).execute(query)
+        writer.writerow(result.keys())  # headers
+        for rows in result.partitions():
+            writer.writerows(rows)  # Row iterates like a tuple, no per-row list() copy
+            if buffer.tell() >= CSV_CHUNK_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+    yield buffer.getvalue()
 
-    output.seek(0)
-    return StreamingResponse(output, media_type="text/csv", headers={"Content-Disposition": "attachment; filename=data.csv"})
+
+@app.get("/sourav/export")
+def export_scraped_data():
+    return StreamingResponse(
+        stream_csv_rows(scraped_data.select()),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=data.csv"},
+    )
 
 
 # POST REQUESTS :
@@ -132,6 +295,7 @@ def add_scraped_data(data: ScrapedData, db: Session = Depends(get_db)):
         )
         db.execute(new_data)
         db.commit()
+        invalidate_cached_reads()
         return {"message": "Data added successfully"}
     except Exception as e:
         db.rollback()
@@ -149,6 +313,7 @@ def update_scraped_data(data_id: int, data: ScrapedData, db: Session = Depends(g
         )
         db.execute(update_query)
         db.commit()
+        invalidate_cached_reads()
         return {"message": "Data updated successfully"}
     except Exception as e:
         db.rollback()
@@ -162,6 +327,7 @@ def delete_scraped_data(name: str, db: Session = Depends(get_db)):
         delete_query = scraped_data.delete().where(scraped_data.c.name == name)
         db.execute(delete_query)
         db.commit()
+        invalidate_cached_reads()
         return {"message": "Data deleted successfully"}
     except Exception as e:
         db.rollback()
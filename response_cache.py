@@ -0,0 +1,54 @@
+import sqlite3
+import threading
+import time
+
+# Kept apart from sourav.db so a crawl holding the write lock can't block cache reads
+CACHE_DB_PATH = "./response_cache.db"
+# Expired entries are kept for the stale fallback, so the table is bounded by count instead
+MAX_ENTRIES = 256
+
+
+class ResponseCache:
+    """Small SQLite-backed store for GET response bodies, keyed by path + query."""
+
+    def __init__(self, path=CACHE_DB_PATH, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.con = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.con.execute("PRAGMA journal_mode=WAL")
+        self.con.execute("PRAGMA synchronous=NORMAL")
+        self.con.execute("""CREATE TABLE IF NOT EXISTS cache(
+                         key TEXT PRIMARY KEY,
+                         body BLOB,
+                         media_type TEXT,
+                         stale_at REAL
+                         )
+                         """)
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Returns (body, media_type, is_fresh) for a cached entry, or None on a miss."""
+        with self.lock:
+            row = self.con.execute(
+                "SELECT body, media_type, stale_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, media_type, stale_at = row
+        return body, media_type, stale_at > time.time()
+
+    def set(self, key, body, media_type, ttl):
+        with self.lock:
+            self.con.execute(
+                "INSERT OR REPLACE INTO cache (key, body, media_type, stale_at) VALUES (?, ?, ?, ?)",
+                (key, body, media_type, time.time() + ttl),
+            )
+            # Over the cap, the entries that went stale longest ago are dropped first
+            self.con.execute(
+                "DELETE FROM cache WHERE key NOT IN (SELECT key FROM cache ORDER BY stale_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def invalidate_prefix(self, prefix):
+        """Drops every entry whose key starts with ``prefix``."""
+        with self.lock:
+            self.con.execute("DELETE FROM cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
@@ -0,0 +1,78 @@
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import Future
+
+from scrapy.crawler import CrawlerRunner
+from scrapy.utils.project import get_project_settings
+from scrapy.utils.reactor import install_reactor
+
+from vorys.spiders.vorysdata import VorysdataSpider
+
+# Crawls run in this process on one long-lived Twisted reactor thread, instead of
+# forking a new `scrapy crawl` interpreter (and reactor, and settings load) per request.
+_runner = None
+_reactor_ready = threading.Event()
+
+# Crawl logs are appended to this file as they're emitted, rather than collected in memory
+CRAWL_LOG_PATH = os.path.join(tempfile.gettempdir(), "vorys_crawl.log")
+
+
+def _log_crawls_to_file(settings):
+    """Sends Scrapy's and the spider's log records to CRAWL_LOG_PATH instead of the API's console."""
+    handler = logging.FileHandler(CRAWL_LOG_PATH, encoding="utf-8")
+    handler.setFormatter(logging.Formatter(settings.get("LOG_FORMAT"), settings.get("LOG_DATEFORMAT")))
+    for name in ("scrapy", "twisted", VorysdataSpider.name):
+        logger = logging.getLogger(name)
+        logger.setLevel(settings.get("LOG_LEVEL"))
+        logger.addHandler(handler)
+        logger.propagate = False
+
+
+def start_reactor():
+    """Starts the Twisted reactor on a daemon thread and builds the shared CrawlerRunner."""
+    if _reactor_ready.is_set():
+        return
+    settings = get_project_settings()
+    _log_crawls_to_file(settings)
+
+    def run():
+        global _runner
+        # Installed from this thread so the asyncio reactor gets its own event loop
+        install_reactor(settings["TWISTED_REACTOR"])
+        from twisted.internet import reactor
+
+        _runner = CrawlerRunner(settings)
+        reactor.callWhenRunning(_reactor_ready.set)
+        reactor.run(installSignalHandlers=False)
+
+    threading.Thread(target=run, name="twisted-reactor", daemon=True).start()
+    _reactor_ready.wait()
+
+
+def crawl():
+    """Schedules a vorysdata crawl on the reactor thread.
+
+    Returns a concurrent.futures.Future that resolves when the crawl finishes, so
+    async callers can `await asyncio.wrap_future(crawl())`.
+    """
+    from twisted.internet import reactor
+
+    future = Future()
+
+    def schedule():
+        # Anything raised here would only reach the reactor's log, so it goes to the
+        # Future instead, e.g. if start_reactor() hasn't run or crawl() fails outright
+        try:
+            deferred = _runner.crawl(VorysdataSpider)
+        except Exception as e:
+            future.set_exception(e)
+            return
+        deferred.addCallbacks(
+            lambda _: future.set_result(None),
+            lambda failure: future.set_exception(failure.value),
+        )
+
+    reactor.callFromThread(schedule)
+    return future
@@ -0,0 +1,27 @@
+import importlib
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture(scope="session")
+def client(tmp_path_factory):
+    """A TestClient over a scratch copy of sourav.db.
+
+    The app opens ./sourav.db and ./response_cache.db relative to the working
+    directory, so the tests run from a temp dir holding a copy of the DB.
+    The client isn't entered as a context manager, so the lifespan (which
+    starts the crawl reactor) doesn't run.
+    """
+    workdir = tmp_path_factory.mktemp("api")
+    shutil.copy(REPO_ROOT / "sourav.db", workdir / "sourav.db")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(workdir)
+        main = importlib.import_module("main")
+        yield TestClient(main.app)
@@ -0,0 +1,103 @@
+import sqlite3
+from concurrent.futures import Future
+
+import orjson
+import pytest
+
+
+def test_sourav_streams_every_row_as_json(client):
+    response = client.get("/sourav")
+
+    assert response.status_code == 200
+    rows = orjson.loads(response.content)
+    with sqlite3.connect("sourav.db") as con:
+        expected = con.execute("SELECT COUNT(*) FROM vorysdata").fetchone()[0]
+    assert len(rows) == expected
+    assert {"name", "position", "location", "email"} <= rows[0].keys()
+
+
+def test_repeat_get_is_served_from_cache(client):
+    first = client.get("/sourav/search", params={"location": "col"})
+    second = client.get("/sourav/search", params={"location": "col"})
+
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.content == first.content
+
+
+def test_unknown_query_params_share_one_cache_entry(client):
+    first = client.get("/sourav/search", params={"name": "zz", "junk": "1"})
+    second = client.get("/sourav/search", params={"name": "zz", "junk": "2"})
+
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+
+
+def test_stale_copy_is_served_when_the_handler_fails(client, monkeypatch):
+    import main
+
+    fresh = client.get("/sourav/search", params={"name": "stale"})
+    main.response_cache.con.execute("UPDATE cache SET stale_at = 0")
+    # Any query the handler builds now fails before a response starts
+    monkeypatch.setattr(main, "scraped_data", None)
+    response = client.get("/sourav/search", params={"name": "stale"})
+
+    assert response.headers["x-cache"] == "STALE"
+    assert response.content == fresh.content
+
+
+def test_body_that_fails_mid_stream_is_not_cached(client, monkeypatch):
+    import main
+
+    def broken_rows(query):
+        yield b"["
+        raise RuntimeError("cursor died")
+
+    monkeypatch.setattr(main, "stream_json_rows", broken_rows)
+    with pytest.raises(RuntimeError):
+        client.get("/sourav/search", params={"name": "broken"})
+    monkeypatch.undo()
+
+    response = client.get("/sourav/search", params={"name": "broken"})
+    assert response.headers["x-cache"] == "MISS"
+    assert orjson.loads(response.content) == []
+
+
+def test_paginated_works_on_a_fresh_baseline_db(client):
+    response = client.get("/sourav/paginated", params={"limit": 5})
+
+    assert response.status_code == 200
+    page = response.json()
+    assert [row["id"] for row in page["items"]] == sorted(row["id"] for row in page["items"])
+    assert page["next_after"] == page["items"][-1]["id"]
+
+
+def test_search_uses_the_fts_index_created_at_startup(client):
+    response = client.get("/sourav/search", params={"name": "mart"})
+
+    assert response.status_code == 200
+    rows = orjson.loads(response.content)
+    assert rows
+    assert all("mart" in row["name"].lower() for row in rows)
+
+
+def test_failed_background_crawl_releases_the_spider_lock(client, monkeypatch):
+    import main
+
+    def failing_crawl():
+        future = Future()
+        future.set_exception(RuntimeError("reactor not started"))
+        return future
+
+    monkeypatch.setattr(main.spider_runner, "crawl", failing_crawl)
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert not main.spider_lock.locked()
+
+
+@pytest.mark.parametrize("limit", [0, -1, 501])
+def test_paginated_rejects_out_of_range_limits(client, limit):
+    response = client.get("/sourav/paginated", params={"limit": limit})
+
+    assert response.status_code == 422
@@ -0,0 +1,45 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from vorys.pipelines import VorysPipeline
+
+SPIDER = SimpleNamespace(logger=logging.getLogger("vorysdata"))
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(VorysPipeline, "schema_ready", False)
+    pipeline = VorysPipeline()
+    pipeline.open_spider(SPIDER)
+    yield pipeline
+    pipeline.con.close()
+
+
+def member(name, email):
+    return {"name": name, "position": "Partner", "location": "akron", "email": email}
+
+
+def test_failed_batch_is_retried_row_by_row(pipeline):
+    # Rejects one specific member, as a constraint or bad value would
+    pipeline.cur.execute(
+        """CREATE TRIGGER reject_bad BEFORE INSERT ON vorysdata WHEN new.name = 'bad'
+           BEGIN SELECT RAISE(ABORT, 'rejected'); END"""
+    )
+    for item in (member("ann", "a@vorys.com"), member("bad", "b@vorys.com"), member("cy", "c@vorys.com")):
+        pipeline.process_item(item, SPIDER)
+    pipeline.flush(SPIDER)
+
+    names = [row[0] for row in pipeline.cur.execute("SELECT name FROM vorysdata ORDER BY rowid")]
+    assert names == ["ann", "cy"]
+    assert ("bad", "akron", "b@vorys.com") not in pipeline.seen
+
+
+def test_repeated_member_is_written_once(pipeline):
+    pipeline.process_item(member("ann", "a@vorys.com"), SPIDER)
+    pipeline.process_item(member("Ann ", "A@vorys.com"), SPIDER)
+    pipeline.flush(SPIDER)
+
+    assert pipeline.cur.execute("SELECT COUNT(*) FROM vorysdata").fetchone()[0] == 1
@@ -0,0 +1,12 @@
+from response_cache import ResponseCache
+
+
+def test_set_keeps_at_most_max_entries(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.db", max_entries=2)
+
+    for ttl, key in enumerate(["a", "b", "c"]):
+        cache.set(key, b"[]", "application/json", ttl)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.get("c") is not None
@@ -0,0 +1,36 @@
+import sqlite3
+
+from vorys.schema import SCHEMA_VERSION, ensure_schema
+
+
+def make_v1_db(path, rows):
+    """A schema-v1 vorysdata table (case-sensitive name/location) holding ``rows``."""
+    con = sqlite3.connect(path)
+    con.execute(
+        """CREATE TABLE vorysdata(
+               id INTEGER PRIMARY KEY AUTOINCREMENT,
+               name TEXT, position TEXT, location TEXT, email TEXT,
+               UNIQUE(name,location,email))"""
+    )
+    con.executemany("INSERT INTO vorysdata (name, position, location, email) VALUES (?, ?, ?, ?)", rows)
+    con.execute("PRAGMA user_version = 1")
+    con.commit()
+    return con
+
+
+def test_migration_folds_rows_that_differ_only_in_case(tmp_path):
+    con = make_v1_db(tmp_path / "sourav.db", [
+        ("ann lee", "Partner", "akron", "al@vorys.com"),
+        ("Ann Lee", "Associate", "Akron", "al@vorys.com"),
+        ("bo li", "Partner", "columbus", "bl@vorys.com"),
+    ])
+
+    ensure_schema(con)
+
+    assert con.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    assert con.execute("SELECT id, name, position FROM vorysdata ORDER BY id").fetchall() == [
+        (1, "ann lee", "Partner"),
+        (3, "bo li", "Partner"),
+    ]
+    assert con.execute("SELECT rowid FROM vorysdata_fts WHERE vorysdata_fts MATCH 'ann'").fetchall() == [(1,)]
+    con.execute("INSERT INTO vorysdata_fts(vorysdata_fts) VALUES ('integrity-check')")
@@ -8,43 +8,94 @@
 from itemadapter import ItemAdapter
 import sqlite3
 
+from vorys.schema import SQLITE_PRAGMAS, ensure_schema
+
 class VorysPipeline:
-    def __init__(self):
-        self.con = sqlite3.connect('sourav.db')
+    # Rows are upserted in batches: one executemany + commit (one fsync) per BATCH items
+    BATCH = 200
+    # Re-scraped rows whose position hasn't changed are left alone: no page write, no FTS update trigger
+    UPSERT_SQL = """
+        INSERT INTO vorysdata (name, position, location, email)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(name, location, email)
+        DO UPDATE SET
+            position = excluded.position
+        WHERE position IS NOT excluded.position
+    """
+
+    # Schema setup only needs to run once per process; crawls on the API's reactor reuse the result
+    schema_ready = False
+
+    def open_spider(self, spider):
+        # Autocommit mode: flush() opens and commits each batch's transaction itself.
+        # The timeout waits out API writes holding the lock instead of failing the batch.
+        self.con = sqlite3.connect('sourav.db', isolation_level=None, check_same_thread=False, timeout=30)
 
         self.cur = self.con.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            self.cur.execute(pragma)
+
+        if not VorysPipeline.schema_ready:
+            ensure_schema(self.con)
+            VorysPipeline.schema_ready = True
+
+        self.buf = []
+        # (name, location, email) keys already upserted this crawl; one entry per member
+        self.seen = set()
 
-        self.cur.execute("""CREATE TABLE IF NOT EXISTS vorysdata(
-                         name TEXT,
-                         position TEXT,
-                         location TEXT,
-                         email TEXT,
-                        UNIQUE(name,location,email)  
-                          ) 
-                         """)
-        # self.con.commit()
     def process_item(self, item, spider):
         
+        # Missing fields come through as None; `or ""` keeps them from being stored as "none"
+        name = (item.get('name') or "").strip().lower()
+        position = (item.get('position') or "").strip()
+        location = (item.get('location') or "").strip().lower()
+        email = (item.get('email') or "").strip().lower()
+
+        # Skip ONLY if all fields are empty
+        if not any([name, position, location, email]):
+            return item
+
+        # The same member can turn up on more than one page; only the first is written
+        key = (name, location, email)
+        if key in self.seen:
+            return item
+        self.seen.add(key)
+
+        self.buf.append((name, position, location, email))
+        if len(self.buf) >= self.BATCH:
+            self.flush(spider)
+
+        return item
+
+    def flush(self, spider):
+        if not self.buf:
+            return
         try:
-                name = str(item['name']).strip().lower()
-                position = str(item['position']).strip()
-                location = str(item['location']).strip().lower()
-                email = str(item['email']).strip().lower()
-
-                # Skip ONLY if all fields are empty
-                if not any([name, position, location, email]):
-                    pass
-
-                self.cur.execute("""
-                    INSERT INTO vorysdata (name, position, location, email)
-                    VALUES (?, ?, ?, ?)
-                    ON CONFLICT(name, location, email)
-                    DO UPDATE SET
-                        position = excluded.position
-                """, (name, position, location, email))
-
-                self.con.commit()
+            self.cur.execute("BEGIN")
+            self.cur.executemany(self.UPSERT_SQL, self.buf)
+            self.cur.execute("COMMIT")
         except sqlite3.Error as e:
-            spider.logger.error(f"DB error: {e}")
-    
-        return item
+            self.con.rollback()
+            spider.logger.warning(f"Batch upsert failed ({e}), retrying row by row")
+            self.retry_rows(spider)
+        finally:
+            self.buf.clear()
+
+    def retry_rows(self, spider):
+        # Autocommit: each row commits on its own, so one bad row only loses itself
+        for row in self.buf:
+            try:
+                self.cur.execute(self.UPSERT_SQL, row)
+            except sqlite3.Error as e:
+                spider.logger.error(f"DB error: {e}")
+                # Let a later copy of this member in the same crawl try again
+                name, _, location, email = row
+                self.seen.discard((name, location, email))
+
+    def close_spider(self, spider):
+        # Write out whatever is left of the last partial batch
+        self.flush(spider)
+        # Refresh planner statistics so lookups by id/name pick the indexes
+        self.cur.execute("ANALYZE vorysdata")
+        self.con.commit()
+        self.con.close()
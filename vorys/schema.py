@@ -0,0 +1,99 @@
+# sourav.db connection settings and vorysdata table definition, shared by the spider
+# pipeline and the API (database.py), so whichever opens sourav.db first brings it up
+# to the current schema.
+import sqlite3
+
+# WAL so the crawl doesn't block dashboard reads, no fsync on every commit, and a
+# 64 MiB page cache plus memory-mapped reads. Run on every new connection.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Bumped whenever the vorysdata definition changes; tracked in PRAGMA user_version
+SCHEMA_VERSION = 2
+
+# id aliases SQLite's rowid, so /sourav/update/{id} and keyset pagination seek on the PK.
+# NOCASE on the searched columns lets case-insensitive LIKE prefix matches use their indexes.
+TABLE_SCHEMA = """CREATE TABLE IF NOT EXISTS {table}(
+                         id INTEGER PRIMARY KEY AUTOINCREMENT,
+                         name TEXT COLLATE NOCASE,
+                         position TEXT,
+                         location TEXT COLLATE NOCASE,
+                         email TEXT,
+                        UNIQUE(name,location,email)
+                          )
+                         """
+
+# Trigram full-text index over vorysdata for /sourav/search, so substring searches
+# use the index instead of a LIKE '%...%' table scan. Triggers keep it in sync.
+FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS vorysdata_fts USING fts5(
+        name, position, location, email,
+        content='vorysdata', content_rowid='rowid', tokenize='trigram'
+    );
+    CREATE TRIGGER IF NOT EXISTS vorysdata_fts_ai AFTER INSERT ON vorysdata BEGIN
+        INSERT INTO vorysdata_fts(rowid, name, position, location, email)
+        VALUES (new.rowid, new.name, new.position, new.location, new.email);
+    END;
+    CREATE TRIGGER IF NOT EXISTS vorysdata_fts_ad AFTER DELETE ON vorysdata BEGIN
+        INSERT INTO vorysdata_fts(vorysdata_fts, rowid, name, position, location, email)
+        VALUES ('delete', old.rowid, old.name, old.position, old.location, old.email);
+    END;
+    CREATE TRIGGER IF NOT EXISTS vorysdata_fts_au AFTER UPDATE ON vorysdata BEGIN
+        INSERT INTO vorysdata_fts(vorysdata_fts, rowid, name, position, location, email)
+        VALUES ('delete', old.rowid, old.name, old.position, old.location, old.email);
+        INSERT INTO vorysdata_fts(rowid, name, position, location, email)
+        VALUES (new.rowid, new.name, new.position, new.location, new.email);
+    END;
+"""
+
+
+def ensure_schema(con):
+    """Creates or migrates vorysdata, its name index and the FTS index on ``con``."""
+    cur = con.cursor()
+    cur.execute(TABLE_SCHEMA.format(table="vorysdata"))
+    migrated = migrate(con)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_vorys_name ON vorysdata(name)")
+
+    fts_exists = cur.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'vorysdata_fts'"
+    ).fetchone()
+    cur.executescript(FTS_SCHEMA)
+    if not fts_exists or migrated:
+        # Index the rows that were scraped before the FTS table existed, or
+        # drop the entries of rows the migration folded into a duplicate
+        cur.execute("INSERT INTO vorysdata_fts(vorysdata_fts) VALUES ('rebuild')")
+    con.commit()
+
+
+def migrate(con):
+    """Rebuilds a vorysdata table from an older schema, keeping rowids as ids.
+
+    Returns True if the table was rebuilt.
+    """
+    cur = con.cursor()
+    version = cur.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return False
+    # rowid equals id once the table has one, so this keeps existing ids either way.
+    # Rows that only differ in case collide under NOCASE; OR IGNORE keeps the oldest one.
+    # Dropping the old table also drops its index and FTS triggers; they're recreated after.
+    try:
+        cur.executescript(
+            "BEGIN;"
+            + TABLE_SCHEMA.format(table="vorysdata_new") + ";"
+            + """INSERT OR IGNORE INTO vorysdata_new (id, name, position, location, email)
+                     SELECT rowid, name, position, location, email FROM vorysdata ORDER BY rowid;
+                 DROP TABLE vorysdata;
+                 ALTER TABLE vorysdata_new RENAME TO vorysdata;
+                 COMMIT;"""
+        )
+    except sqlite3.Error:
+        con.rollback()
+        raise
+    cur.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return True
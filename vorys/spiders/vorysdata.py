@@ -11,12 +11,12 @@ class VorysdataSpider(scrapy.Spider):
         members = response.css('ul.results_list li')
 
         for member in members:
-            try:
-                email = member.css("div.email a::attr('href')").get().replace("mailto:","")
-            except:
-                email = None
+            name = member.css('div.title a::text').get()
+            if not name:
+                continue  # not a profile entry, nothing worth storing
+            email = member.css("div.email a::attr('href')").get(default="").replace("mailto:","") or None
             yield{
-                'name' : member.css('div.title a::text').get(),
+                'name' : name,
                 'position' : member.css("div.position ::text").get(),
                 'location' : member.css("div.office a::text").get(),
                 'email' : email,